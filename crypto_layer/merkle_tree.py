@@ -1,18 +1,144 @@
 import hashlib
+from typing import Dict, Iterable, List
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Node hash constructors by name; each yields a 32-byte digest. SHA-256 is the
+# default. The BLAKE variants hash 64-byte nodes faster but give different
+# roots, so only use them where nothing else verifies with SHA-256.
+HASH_BACKENDS = {"sha256": hashlib.sha256, "blake2s": hashlib.blake2s}
+if blake3 is not None:
+    HASH_BACKENDS["blake3"] = blake3.blake3
+
+def _hash_constructor(hash_backend: str):
+    try:
+        return HASH_BACKENDS[hash_backend]
+    except KeyError:
+        raise ValueError(f"Unsupported hash backend: {hash_backend}") from None
 
 def sha256(data: str) -> str:
     return hashlib.sha256(data.encode()).hexdigest()
 
-def build_merkle_tree(leaves):
+def sha256_bytes(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+def hash_bytes(data: bytes, hash_backend: str = "sha256") -> bytes:
+    return _hash_constructor(hash_backend)(data).digest()
+
+def hash_level(level: List[bytes], hash_backend: str = "sha256") -> List[bytes]:
+    # Hash every (left, right) pair of a level in one pass; an odd trailing
+    # node is paired with itself. Pairing through one shared iterator avoids
+    # copying the level into padded or sliced lists.
+    hash_fn = _hash_constructor(hash_backend)
+    pairs = iter(level)
+    nodes = [hash_fn(left + right).digest() for left, right in zip(pairs, pairs)]
+    if len(level) % 2:
+        nodes.append(hash_fn(level[-1] * 2).digest())
+    return nodes
+
+def build_merkle_tree(leaves: List[bytes], hash_backend: str = "sha256") -> List[List[bytes]]:
+    # Nodes are raw 32-byte digests; hex-encode only when displaying or serialising
     tree = [leaves]
     while len(tree[-1]) > 1:
-        level = []
-        for i in range(0, len(tree[-1]), 2):
-            left = tree[-1][i]
-            right = tree[-1][i+1] if i+1 < len(tree[-1]) else left
-            level.append(sha256(left + right))
-        tree.append(level)
+        tree.append(hash_level(tree[-1], hash_backend))
     return tree
 
-def get_merkle_root(leaves):
-    return build_merkle_tree(leaves)[-1][0]
+def get_merkle_root(leaves: List[bytes], hash_backend: str = "sha256") -> bytes:
+    return build_merkle_tree(leaves, hash_backend)[-1][0]
+
+def append_leaf(tree: List[List[bytes]], leaf: bytes, hash_backend: str = "sha256") -> None:
+    # Extends a built tree in place. Only the right-most path changes, so this
+    # rehashes O(log N) nodes instead of rebuilding the whole tree.
+    hash_fn = _hash_constructor(hash_backend)
+    tree[0].append(leaf)
+    index = len(tree[0]) - 1
+    for depth in range(len(tree) - 1):
+        level, parents = tree[depth], tree[depth + 1]
+        left_index = index & ~1
+        left = level[left_index]
+        right = level[left_index + 1] if left_index + 1 < len(level) else left
+        node = hash_fn(left + right).digest()
+        index >>= 1
+        if index < len(parents):
+            parents[index] = node
+        else:
+            parents.append(node)
+    while len(tree[-1]) > 1:
+        tree.append(hash_level(tree[-1], hash_backend))
+
+def get_merkle_proof(tree: List[List[bytes]], index: int) -> List[bytes]:
+    # Reads siblings from an already built tree, so callers holding the levels
+    # never rehash. A node without a sibling was paired with itself.
+    if not 0 <= index < len(tree[0]):
+        raise IndexError(f"Leaf index {index} out of range")
+    proof = []
+    for depth, level in enumerate(tree[:-1]):
+        node_index = index >> depth
+        sibling_index = node_index ^ 1
+        proof.append(level[sibling_index] if sibling_index < len(level) else level[node_index])
+    return proof
+
+def verify_merkle_proof(leaf: bytes, index: int, proof: List[bytes], root: bytes,
+                        leaf_count: int, hash_backend: str = "sha256") -> bool:
+    # The index must name a real leaf and the proof must span the full tree
+    # depth; otherwise the self-paired tail or an internal node could pass
+    if not 0 <= index < leaf_count or len(proof) != (leaf_count - 1).bit_length():
+        return False
+    hash_fn = _hash_constructor(hash_backend)
+    node = leaf
+    for depth, sibling in enumerate(proof):
+        pair = sibling + node if (index >> depth) & 1 else node + sibling
+        node = hash_fn(pair).digest()
+    return node == root
+
+def get_merkle_multiproof(tree: List[List[bytes]], indices: Iterable[int]) -> List[bytes]:
+    # Siblings needed to prove several leaves at once. Nodes the verifier can
+    # compute itself (other proven leaves and their ancestors) are left out,
+    # so shared parts of the paths are sent only once.
+    proof = []
+    known = sorted(set(indices))
+    for index in known:
+        if not 0 <= index < len(tree[0]):
+            raise IndexError(f"Leaf index {index} out of range")
+    for level in tree[:-1]:
+        known_set = set(known)
+        for index in known:
+            sibling_index = index ^ 1
+            if sibling_index < len(level) and sibling_index not in known_set:
+                proof.append(level[sibling_index])
+        known = sorted({index >> 1 for index in known})
+    return proof
+
+def verify_merkle_multiproof(leaves: Dict[int, bytes], proof: List[bytes],
+                             root: bytes, leaf_count: int, hash_backend: str = "sha256") -> bool:
+    # leaves maps leaf index -> leaf hash for every proven leaf. Indices past
+    # the end are rejected: the self-paired tail would otherwise let the last
+    # real leaf stand in for a leaf that does not exist.
+    if any(not 0 <= index < leaf_count for index in leaves):
+        return False
+    hash_fn = _hash_constructor(hash_backend)
+    nodes = dict(sorted(leaves.items()))
+    siblings = iter(proof)
+    size = leaf_count
+    while size > 1:
+        parents = {}
+        for index, node in nodes.items():
+            if index >> 1 in parents:
+                continue
+            sibling_index = index ^ 1
+            if sibling_index in nodes:
+                sibling = nodes[sibling_index]
+            elif sibling_index >= size:
+                sibling = node
+            else:
+                sibling = next(siblings, None)
+                if sibling is None:
+                    return False
+            pair = sibling + node if index & 1 else node + sibling
+            parents[index >> 1] = hash_fn(pair).digest()
+        nodes = parents
+        size = (size + 1) >> 1
+    return next(siblings, None) is None and nodes == {0: root}
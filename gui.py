@@ -843,7 +843,7 @@ Powered by AI & Blockchain
             return
         
         try:
-            from crypto_layer.merkle_tree import build_merkle_tree, get_merkle_root, sha256
+            from crypto_layer.merkle_tree import build_merkle_tree, sha256_bytes
             
             self.blockchain_text.delete('1.0', tk.END)
             
@@ -859,9 +859,10 @@ Powered by AI & Blockchain
                 metrics = result['metrics']
                 # Create leaf hash from company data
                 data = f"{result['company']}|{metrics.get('reserves', 0)}|{metrics.get('supply', 0)}|{metrics.get('price', 0)}"
-                leaf_hash = sha256(data)
+                leaf_hash = sha256_bytes(data.encode())
                 leaves.append(leaf_hash)
-                report.append(f"Leaf: {result['company'][:30]:<30} -> {leaf_hash[:16]}...{leaf_hash[-16:]}")
+                leaf_hex = leaf_hash.hex()
+                report.append(f"Leaf: {result['company'][:30]:<30} -> {leaf_hex[:16]}...{leaf_hex[-16:]}")
             
             report.append("")
             report.append("─" * 80)
@@ -870,7 +871,7 @@ Powered by AI & Blockchain
             
             # Build tree
             tree = build_merkle_tree(leaves)
-            root = get_merkle_root(leaves)
+            root = tree[-1][0].hex()
             
             report.append(f"Tree Levels:    {len(tree)}")
             report.append(f"Total Leaves:   {len(leaves)}")
@@ -885,7 +886,7 @@ Powered by AI & Blockchain
             
             for level_idx, level in enumerate(reversed(tree)):
                 if level_idx == 0:
-                    report.append(f"Level {len(tree) - level_idx - 1} (ROOT):    {level[0][:16]}...{level[0][-16:]}")
+                    report.append(f"Level {len(tree) - level_idx - 1} (ROOT):    {root[:16]}...{root[-16:]}")
                 elif level_idx == len(tree) - 1:
                     report.append(f"Level 0 (LEAVES):  {len(level)} leaves")
                 else:
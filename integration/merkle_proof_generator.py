@@ -3,36 +3,75 @@ merkle_proof_generator.py
 Generates Merkle proofs from mock custodian balances for off-chain integration.
 """
 
+import json
+import sys
+
 from data_layer.collectors.mock_custodian import get_mock_reserves
-from crypto_layer.merkle_tree import build_merkle_tree, sha256
+from crypto_layer.merkle_tree import (
+    append_leaf,
+    build_merkle_tree,
+    get_merkle_multiproof,
+    get_merkle_proof,
+    hash_bytes,
+    verify_merkle_multiproof,
+)
 
 class MerkleProofGenerator:
-    def __init__(self):
+    def __init__(self, hash_backend="sha256"):
+        # hash_backend names an entry in crypto_layer.merkle_tree.HASH_BACKENDS
+        self.hash_backend = hash_backend
         self.reserves = get_mock_reserves()
         self.leaves = [self._leaf_hash(r) for r in self.reserves]
-        self.tree = build_merkle_tree(self.leaves)
+        self.tree = build_merkle_tree(self.leaves, hash_backend)
 
     def _leaf_hash(self, reserve):
         # Hash account and balance as a string
-        return sha256(f"{reserve['account']}:{reserve['balance']}")
+        return hash_bytes(f"{reserve['account']}:{reserve['balance']}".encode(), self.hash_backend)
+
+    def append_reserve(self, reserve):
+        # Adds a reserve without rebuilding the tree; self.leaves is the tree's
+        # bottom level, so it grows with it
+        self.reserves.append(reserve)
+        append_leaf(self.tree, self._leaf_hash(reserve), self.hash_backend)
 
     def get_merkle_root(self):
         return self.tree[-1][0] if self.tree else None
 
     def get_proof(self, index):
         # Returns the Merkle proof for the leaf at the given index
-        proof = []
-        num_levels = len(self.tree)
-        for level in range(num_levels - 1):
-            level_nodes = self.tree[level]
-            sibling_index = index ^ 1
-            if sibling_index < len(level_nodes):
-                proof.append(level_nodes[sibling_index])
-            index //= 2
-        return proof
+        return get_merkle_proof(self.tree, index)
+
+    def get_multiproof(self, indices):
+        # Returns one combined proof covering all the given leaf indices
+        return get_merkle_multiproof(self.tree, indices)
 
 if __name__ == "__main__":
+    # Optional leaf indices on the command line select reserves to prove
+    # together with one combined multiproof
+    selected = sorted({int(arg) for arg in sys.argv[1:]})
     mpg = MerkleProofGenerator()
-    print("Merkle Root:", mpg.get_merkle_root())
-    for i, reserve in enumerate(mpg.reserves):
-        print(f"Proof for {reserve['account']}: {mpg.get_proof(i)}")
+    root = mpg.get_merkle_root()
+    # Proofs stay raw bytes in Python; hex-encode only for the JSON output
+    out = {
+        "hashBackend": mpg.hash_backend,
+        "root": root.hex(),
+        "entries": [
+            {
+                "account": r["account"],
+                "balance": r["balance"],
+                "leaf": mpg.leaves[i].hex(),
+                "proof": [h.hex() for h in mpg.get_proof(i)],
+            }
+            for i, r in enumerate(mpg.reserves)
+        ],
+    }
+    if selected:
+        proof = mpg.get_multiproof(selected)
+        # Leaf hashes were computed once in __init__; reuse them rather than rehashing
+        leaves = {i: mpg.leaves[i] for i in selected}
+        out["multiproof"] = {
+            "indices": selected,
+            "proof": [h.hex() for h in proof],
+            "verified": verify_merkle_multiproof(leaves, proof, root, len(mpg.leaves), mpg.hash_backend),
+        }
+    print(json.dumps(out, indent=2))
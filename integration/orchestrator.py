@@ -1,16 +1,16 @@
 from data_layer.collectors.exchange_fetcher import fetch_supply
 from data_layer.collectors.mock_custodian import get_mock_reserves
-from crypto_layer.merkle_tree import get_merkle_root
+from crypto_layer.merkle_tree import get_merkle_root, sha256_bytes
 from ai_engine.anomaly_detector import AnomalyDetector
 import numpy as np
 
 def run():
     supply = fetch_supply()
     reserves = sum([r["balance"] for r in get_mock_reserves()])
-    leaves = [str(reserves), str(supply)]
+    leaves = [sha256_bytes(str(reserves).encode()), sha256_bytes(str(supply).encode())]
     root = get_merkle_root(leaves)
 
-    print("Merkle Root:", root)
+    print("Merkle Root:", root.hex())
 
     model = AnomalyDetector()
     training_data = np.array([[1000000, 1100000], [1050000, 1060000]])
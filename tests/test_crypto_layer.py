@@ -0,0 +1,207 @@
+import sys
+import os
+import hashlib
+import unittest
+from unittest.mock import patch
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from crypto_layer.merkle_tree import (
+    HASH_BACKENDS,
+    append_leaf,
+    build_merkle_tree,
+    get_merkle_multiproof,
+    get_merkle_proof,
+    get_merkle_root,
+    hash_bytes,
+    hash_level,
+    sha256,
+    sha256_bytes,
+    verify_merkle_proof,
+    verify_merkle_multiproof,
+)
+
+# mock_custodian does not define get_mock_reserves, so provide it while importing
+with patch('data_layer.collectors.mock_custodian.get_mock_reserves', create=True):
+    from integration.merkle_proof_generator import MerkleProofGenerator
+
+# Roots of _leaves(7) per backend, pinned so a changed hash or digest size fails
+EXPECTED_ROOTS = {
+    "sha256": "4640ea3bb4c4bdc28968e088f14b45a1a9ca357543023d4a3a2979d065eac05b",
+    "blake2s": "f9d7c5493df2f2a5d7fe45ffb825b56546af5e77e2d409b5fa5610637355ee15",
+    "blake3": "0a337e4418ed6e890c88572a07a2ee68d09a37cc1f5c4beab17d73f741e1275c",
+}
+
+
+def _leaves(n):
+    return [sha256_bytes(f"acct{i}:{i * 100}".encode()) for i in range(n)]
+
+
+class TestMerkleTree(unittest.TestCase):
+    def test_sha256_helpers(self):
+        self.assertEqual(sha256_bytes(b"abc"), hashlib.sha256(b"abc").digest())
+        self.assertEqual(sha256("abc"), sha256_bytes(b"abc").hex())
+
+    def test_single_leaf_is_root(self):
+        leaves = _leaves(1)
+        self.assertEqual(get_merkle_root(leaves), leaves[0])
+
+    def test_root_over_raw_digests(self):
+        a, b, c = _leaves(3)
+        ab = sha256_bytes(a + b)
+        cc = sha256_bytes(c + c)
+        self.assertEqual(get_merkle_root([a, b, c]), sha256_bytes(ab + cc))
+
+    def test_tree_levels(self):
+        tree = build_merkle_tree(_leaves(5))
+        self.assertEqual([len(level) for level in tree], [5, 3, 2, 1])
+        self.assertTrue(all(len(node) == 32 for level in tree for node in level))
+
+    def test_hash_level_pairs_odd_tail_with_itself(self):
+        a, b, c = _leaves(3)
+        self.assertEqual(hash_level([a, b, c]), [sha256_bytes(a + b), sha256_bytes(c + c)])
+
+    def test_proof_reads_siblings_from_tree(self):
+        leaves = _leaves(5)
+        tree = build_merkle_tree(leaves)
+        for index, leaf in enumerate(leaves):
+            proof = get_merkle_proof(tree, index)
+            self.assertEqual(len(proof), len(tree) - 1)
+            node, position = leaf, index
+            for sibling in proof:
+                pair = node + sibling if position % 2 == 0 else sibling + node
+                node, position = sha256_bytes(pair), position // 2
+            self.assertEqual(node, tree[-1][0])
+
+    def test_proof_rejects_out_of_range_index(self):
+        tree = build_merkle_tree(_leaves(3))
+        for index in (3, 7, -1):
+            with self.assertRaises(IndexError):
+                get_merkle_proof(tree, index)
+
+    def test_verify_proof(self):
+        leaves = _leaves(6)
+        tree = build_merkle_tree(leaves)
+        root = tree[-1][0]
+        for index, leaf in enumerate(leaves):
+            proof = get_merkle_proof(tree, index)
+            self.assertTrue(verify_merkle_proof(leaf, index, proof, root, 6))
+            self.assertFalse(verify_merkle_proof(leaf, index ^ 1, proof, root, 6))
+
+    def test_verify_proof_rejects_phantom_leaf(self):
+        a, b, c = leaves = _leaves(3)
+        root = get_merkle_root(leaves)
+        self.assertTrue(verify_merkle_proof(c, 2, [c, sha256_bytes(a + b)], root, 3))
+        self.assertFalse(verify_merkle_proof(c, 3, [c, sha256_bytes(a + b)], root, 3))
+        self.assertFalse(verify_merkle_proof(c, -1, [c, sha256_bytes(a + b)], root, 3))
+
+    def test_verify_proof_rejects_internal_node_as_leaf(self):
+        a, b, c = leaves = _leaves(3)
+        tree = build_merkle_tree(leaves)
+        root = tree[-1][0]
+        self.assertFalse(verify_merkle_proof(sha256_bytes(a + b), 0, [tree[1][1]], root, 3))
+        self.assertFalse(verify_merkle_proof(a, 0, get_merkle_proof(tree, 0) + [root], root, 3))
+
+    def test_multiproof_roundtrip(self):
+        for n in (1, 2, 5, 8, 13):
+            leaves = _leaves(n)
+            tree = build_merkle_tree(leaves)
+            root = tree[-1][0]
+            for indices in ([0], [n - 1], list(range(0, n, 3)), list(range(n))):
+                proof = get_merkle_multiproof(tree, indices)
+                proven = {i: leaves[i] for i in indices}
+                self.assertTrue(verify_merkle_multiproof(proven, proof, root, n))
+
+    def test_multiproof_shares_siblings(self):
+        leaves = _leaves(8)
+        tree = build_merkle_tree(leaves)
+        self.assertEqual(get_merkle_multiproof(tree, range(8)), [])
+        self.assertEqual(len(get_merkle_multiproof(tree, [0, 1])), 2)
+
+    def test_multiproof_rejects_tampering(self):
+        leaves = _leaves(6)
+        tree = build_merkle_tree(leaves)
+        root = tree[-1][0]
+        proof = get_merkle_multiproof(tree, [1, 4])
+        self.assertFalse(verify_merkle_multiproof({1: leaves[1], 4: leaves[0]}, proof, root, 6))
+        self.assertFalse(verify_merkle_multiproof({1: leaves[1], 4: leaves[4]}, proof[:-1], root, 6))
+        self.assertFalse(verify_merkle_multiproof({1: leaves[1], 4: leaves[4]}, proof + [root], root, 6))
+
+    def test_multiproof_rejects_phantom_leaf(self):
+        a, b, c = leaves = _leaves(3)
+        root = get_merkle_root(leaves)
+        genuine = get_merkle_multiproof(build_merkle_tree(leaves), [2])
+        self.assertTrue(verify_merkle_multiproof({2: c}, genuine, root, 3))
+        self.assertFalse(verify_merkle_multiproof({3: c}, [c, sha256_bytes(a + b)], root, 3))
+        self.assertFalse(verify_merkle_multiproof({-1: c}, [c, sha256_bytes(a + b)], root, 3))
+
+    def test_multiproof_rejects_out_of_range_index(self):
+        tree = build_merkle_tree(_leaves(3))
+        for index in (3, 7, -1):
+            with self.assertRaises(IndexError):
+                get_merkle_multiproof(tree, [0, index])
+
+    def test_append_leaf_matches_rebuild(self):
+        leaves = _leaves(17)
+        tree = build_merkle_tree([])
+        for n, leaf in enumerate(leaves, 1):
+            append_leaf(tree, leaf)
+            self.assertEqual(tree, build_merkle_tree(leaves[:n]))
+
+    def _check_backend(self, backend):
+        leaves = _leaves(7)
+        tree = build_merkle_tree(leaves, backend)
+        root = tree[-1][0]
+        self.assertEqual(root.hex(), EXPECTED_ROOTS[backend])
+        self.assertEqual(tree[1][0], hash_bytes(leaves[0] + leaves[1], backend))
+        for index, leaf in enumerate(leaves):
+            proof = get_merkle_proof(tree, index)
+            self.assertTrue(verify_merkle_proof(leaf, index, proof, root, 7, backend))
+        proof = get_merkle_multiproof(tree, [2, 5])
+        proven = {2: leaves[2], 5: leaves[5]}
+        self.assertTrue(verify_merkle_multiproof(proven, proof, root, 7, backend))
+
+    def test_hash_backends(self):
+        for backend in ("sha256", "blake2s"):
+            with self.subTest(backend=backend):
+                self._check_backend(backend)
+        self.assertEqual(get_merkle_root(_leaves(7)), get_merkle_root(_leaves(7), "sha256"))
+
+    @unittest.skipUnless("blake3" in HASH_BACKENDS, "blake3 package not installed")
+    def test_blake3_backend(self):
+        self._check_backend("blake3")
+
+    def test_unknown_hash_backend(self):
+        with self.assertRaises(ValueError):
+            build_merkle_tree(_leaves(2), "md5")
+
+
+def _reserves(n):
+    return [{"account": f"acct{i}", "balance": i * 100} for i in range(n)]
+
+
+class TestMerkleProofGenerator(unittest.TestCase):
+    @patch('integration.merkle_proof_generator.get_mock_reserves')
+    def test_append_reserve_matches_rebuild(self, mock_reserves):
+        mock_reserves.return_value = _reserves(5)
+        mpg = MerkleProofGenerator()
+        for reserve in _reserves(9)[5:]:
+            mpg.append_reserve(reserve)
+            self.assertEqual(len(mpg.leaves), len(mpg.reserves))
+            leaves = [hash_bytes(f"{r['account']}:{r['balance']}".encode()) for r in mpg.reserves]
+            self.assertEqual(mpg.tree, build_merkle_tree(leaves))
+
+    @patch('integration.merkle_proof_generator.get_mock_reserves')
+    def test_hash_backend_used_for_leaves_and_nodes(self, mock_reserves):
+        mock_reserves.return_value = _reserves(5)
+        mpg = MerkleProofGenerator(hash_backend="blake2s")
+        mpg.append_reserve(_reserves(6)[5])
+        self.assertEqual(len(mpg.leaves), len(mpg.reserves))
+        leaves = [hash_bytes(f"{r['account']}:{r['balance']}".encode(), "blake2s") for r in mpg.reserves]
+        self.assertEqual(mpg.leaves, leaves)
+        self.assertEqual(mpg.tree, build_merkle_tree(leaves, "blake2s"))
+
+
+if __name__ == '__main__':
+    unittest.main()